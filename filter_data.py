@@ -1,14 +1,22 @@
 import random
 import os
 import sys
+from array import array
 
 def filter_facts(filename, num):
-    with open(filename, "r", encoding="utf-8") as file:
-        basename, ext = filename.split(".")
-        newfile = open(basename+"-"+str(num)+"." + ext, "w", encoding="utf-8")
-        lines = file.readlines()
-        random.shuffle(lines)
-        newfile.writelines(lines[:min(num, len(lines))])
+    with open(filename, "rb", buffering=1 << 20) as file:
+        basename, ext = os.path.splitext(filename)
+        newfile = open(basename+"-"+str(num)+ext, "wb", buffering=1 << 20)
+        offsets = array("q")
+        pos = 0
+        for line in file:
+            offsets.append(pos)
+            pos += len(line)
+        picked = random.sample(offsets, min(num, len(offsets)))
+        picked.sort()
+        for offset in picked:
+            file.seek(offset)
+            newfile.write(file.readline())
         newfile.close()
 
 if __name__ == "__main__":